@@ -15,22 +15,35 @@
 
 import os.path
 import json
+import sys
 from pathlib import Path
 import subprocess
+import functools
 from itertools import chain
 
-import inquirer
+# inquirer (and the readchar/blessed/editor stack it drags in) is imported
+# lazily by the functions that prompt, keeping startup instant for early exits
 
 # --- Config ---
 
-with open(Path.cwd() / '../mdn-bcd-collector/package.json', 'r') as package_file:
-	collector_version = json.load(package_file).get('version', '')
+@functools.cache
+def _collector_version():
+	# Read lazily so importing this module (or bailing out early) costs no I/O
+	with open(Path.cwd() / '../mdn-bcd-collector/package.json', 'r') as package_file:
+		return json.load(package_file).get('version', '')
+
+@functools.cache
+def _mdn_bcd_collector():
+	return f"[mdn-bcd-collector](https://mdn-bcd-collector.gooborg.com) project (v{_collector_version()})"
 
-mdn_bcd_collector = "[mdn-bcd-collector](https://mdn-bcd-collector.gooborg.com) project (v{0})".format(collector_version)
 collector_guide_link = "_Check out the [collector's guide on how to review this PR](https://github.com/openwebdocs/mdn-bcd-collector/blob/main/docs/reviewing-bcd-changes.md)._"
 
+def _intern_keys(d):
+	# Interned keys let dict probes short-circuit on pointer equality
+	return {sys.intern(key): value for key, value in d.items()}
+
 # Titles and descriptions for each type of PR and their specific parameters
-pr_types = {
+pr_types = _intern_keys({
 	"Compat Data Corrections": {
 		"title": "Update {browser} data for {title}",
 		"description": "This PR updates and corrects version values for {browser_full} for the {feature_description}.",
@@ -67,7 +80,7 @@ pr_types = {
 			"description": "This PR removes the unsupported subfeatures of the {feature_description} from BCD.",
 		},
 		"reasons": {
-			"Irrelevant": f"Per the [data guidelines](https://github.com/mdn/browser-compat-data/blob/main/docs/data-guidelines/index.md#removal-of-irrelevant-features), this feature can be considered irrelevant and may be removed from BCD accordingly. Even if the current data suggests that the feature is supported, lack of support has been confirmed by the {mdn_bcd_collector}.",
+			"Irrelevant": "Per the [data guidelines](https://github.com/mdn/browser-compat-data/blob/main/docs/data-guidelines/index.md#removal-of-irrelevant-features), this feature can be considered irrelevant and may be removed from BCD accordingly. Even if the current data suggests that the feature is supported, lack of support has been confirmed by the {mdn_bcd_collector}.",
 			"Non-Interface": "This feature is a type (ex. a dictionary, enum, mixin, constant or WebIDL typedef) that we have explicitly stated not to document separately from the feature(s) that depend on it, as they are virtually invisible to the end developer."
 		},
 		"branch_suffix": "removal"
@@ -83,16 +96,16 @@ pr_types = {
 		},
 		"branch_suffix": "flag-removal"
 	},
-}
+})
 
 # Details on where the data comes from
-data_sources = {
+data_sources = _intern_keys({
 	"mdn-bcd-collector": {
-		"description": f"The data comes from the {mdn_bcd_collector}.\n\n_Check out the [collector's guide on how to review this PR](https://github.com/openwebdocs/mdn-bcd-collector#reviewing-bcd-changes)._",
+		"description": "The data comes from the {mdn_bcd_collector}.\n\n_Check out the [collector's guide on how to review this PR](https://github.com/openwebdocs/mdn-bcd-collector#reviewing-bcd-changes)._",
 		"source": "Tests Used: {source}"
 	},
 	"runtime-compat": {
-		"description": f"The data comes from the {mdn_bcd_collector}, using results collected via [UnJS' runtime-compat project](https://github.com/unjs/runtime-compat).\n\n_Check out the [collector's guide on how to review this PR](https://github.com/openwebdocs/mdn-bcd-collector#reviewing-bcd-changes)._",
+		"description": "The data comes from the {mdn_bcd_collector}, using results collected via [UnJS' runtime-compat project](https://github.com/unjs/runtime-compat).\n\n_Check out the [collector's guide on how to review this PR](https://github.com/openwebdocs/mdn-bcd-collector#reviewing-bcd-changes)._",
 		"source": "Tests Used: {source}"
 	},
 	"Manual": {
@@ -117,10 +130,10 @@ data_sources = {
 		"description": "This sets the feature(s) to a version range based upon the date that the feature was added to BCD with the intent of replacing `true` values with ranged values to eliminate `true` values from BCD.",
 		"source": "Commit/PR Adding the Feature: {source}"
 	}
-}
+})
 
 # More specific categories should always come after less specific ones
-categories = {
+categories = _intern_keys({
 	"api": { "title": "API", "label": "data:api" },
 	"css.at-rules": { "title": "CSS at-rule", "label": "data:css" },
 	"css.selectors": { "title": "CSS selector", "label": "data:css" },
@@ -144,7 +157,7 @@ categories = {
 	"webextensions.manifest": { "title": "Web Extensions manifest property", "label": "data:webext" },
 	"webassembly": { "title": "WebAssembly feature", "label": "data:wasm" },
 	"webassembly.api": { "title": "WebAssembly interface", "label": "data:wasm" },
-}
+})
 
 # All applicable web browsers
 browsers = {
@@ -189,14 +202,43 @@ browsers = {
 	"all": "all browsers",
 }
 
+# Normalize the shorthand string entries into full dicts once, so nothing
+# downstream has to dispatch on the entry type
+browsers = _intern_keys({
+	key: (value if isinstance(value, dict) else {"name": value, "long_name": value})
+	for key, value in browsers.items()
+})
+
+_BROWSER_CHOICES = [
+	(value['name'], {"id": key, **value}) for key, value in browsers.items()
+]
+
 # --- Helper Functions ---
 
+def _build_category_trie():
+	# Index the categories by dotted segment so lookups only walk the feature's
+	# own segments instead of testing every category key (the '' leaf key holds
+	# the category data, as segments themselves are never empty)
+	trie = {}
+	for key, value in categories.items():
+		node = trie
+		for part in key.split('.'):
+			node = node.setdefault(part, {})
+		node[''] = {"key": key, **value}
+	return trie
+
+_cat_trie = _build_category_trie()
+
 def get_category(feature):
 	cat = None
-	for key, value in categories.items():
-		if feature.startswith(key):
-			# We don't return yet as there may be a more specific match
-			cat = {"key": key, **value}
+	node = _cat_trie
+	for part in feature.split('.'):
+		node = node.get(part)
+		if node is None:
+			break
+		if '' in node:
+			# Keep walking, as there may be a more specific match deeper down
+			cat = node['']
 	if not cat:
 		return {"key": "", "title": "feature", "label": None}
 	return cat
@@ -212,9 +254,9 @@ def get_feature_description(feature, category):
 	subfeature = _get_subfeature(feature, category)
 	if subfeature[1]:
 		if subfeature[1].endswith('_static'):
-			return f"`{subfeature[1].replace('_static', '')}` static method of the `{subfeature[0]}` {category['title']}".format(subfeature=subfeature, category=category)
-		return f"`{subfeature[1]}` member of the `{subfeature[0]}` {category['title']}".format(subfeature=subfeature, category=category)
-	return f"`{subfeature[0]}` {category['title']}".format(subfeature=subfeature, category=category)
+			return f"`{subfeature[1].replace('_static', '')}` static method of the `{subfeature[0]}` {category['title']}"
+		return f"`{subfeature[1]}` member of the `{subfeature[0]}` {category['title']}"
+	return f"`{subfeature[0]}` {category['title']}"
 
 def get_feature_title(feature, category):
 	if not category:
@@ -222,13 +264,17 @@ def get_feature_title(feature, category):
 	subfeature = _get_subfeature(feature, category)
 	if subfeature[1]:
 		return feature
-	return f"{subfeature[0]} {category['title']}".format(subfeature=subfeature, category=category)
+	return f"{subfeature[0]} {category['title']}"
+
+# Translation tables mapping feature/flag names to branch names in one pass
+_BRANCH_TABLE = str.maketrans({'.': '/', '*': None})
+_FLAG_TABLE = str.maketrans({'.': '-'})
 
 def get_branch_name(config):
 	if config['flag_removal_type'] == 'by_flag':
-		return f"flagremoval/{config['flag'].replace('.', '-')}/{config['browser']['id']}"
+		return f"flagremoval/{config['flag'].translate(_FLAG_TABLE)}/{config['browser']['id']}"
 
-	branch_name = f"{config['feature'].replace('.', '/').replace('*', '')}"
+	branch_name = config['feature'].translate(_BRANCH_TABLE)
 	branch_suffix = pr_types[config['pr_type']].get('branch_suffix')
 	browser_id = config['browser']['id']
 
@@ -241,22 +287,50 @@ def get_branch_name(config):
 	return branch_name
 
 def get_collector_test_url(feature):
-	base_url = "https://mdn-bcd-collector.gooborg.com/tests/"
 	slug = feature.replace('.', '/')
-	return base_url + slug.replace('/worker_support', '?exposure=Worker')
+	if '/worker_support' in slug:
+		slug = slug.replace('/worker_support', '?exposure=Worker')
+	return f"https://mdn-bcd-collector.gooborg.com/tests/{slug}"
+
+# Cache of parsed BCD files, keyed by file path (mtime is stored to detect edits)
+_json_cache: dict[str, tuple[float, dict]] = {}
+
+def _load_bcd_file(file_path, precheck=None):
+	path_key = str(file_path)
+	st_mtime = os.stat(file_path).st_mtime
+	cached = _json_cache.get(path_key)
+	if cached and cached[0] == st_mtime:
+		return cached[1]
+
+	with open(file_path, 'rb') as file:
+		raw = file.read()
+	# A cheap substring scan can rule a key out without paying for a full parse
+	if precheck is not None and precheck.encode() not in raw:
+		return None
+	obj = json.loads(raw)
+	_json_cache[path_key] = (st_mtime, obj)
+	return obj
 
 def _find_feature_in_file(feature, file_path):
 	parts = feature.split('.')
-	with open(file_path, 'r') as file:
-		obj = json.load(file)
+	obj = _load_bcd_file(file_path, precheck=f'"{parts[0]}"')
+	if obj is None:
+		return False
 
-	for part in parts:
-		obj = obj.get(part)
-		if not obj:
-			return False
+	try:
+		for part in parts:
+			obj = obj[part]
+	except (KeyError, TypeError):
+		return False
 
 	return True
 
+@functools.lru_cache(maxsize=256)
+def _dir_entries(path: str) -> frozenset[str]:
+	# One scandir per directory replaces a pair of stat calls per path part,
+	# and the entries are reused across sibling feature lookups
+	return frozenset(entry.name for entry in os.scandir(path))
+
 def find_file_by_feature(feature, skip_file_search = False):
 	parts = feature.split('.')
 	cwd = Path('.')
@@ -265,7 +339,7 @@ def find_file_by_feature(feature, skip_file_search = False):
 		dir_path = cwd / part
 		json_path = cwd / (part+".json")
 
-		if os.path.exists(json_path):
+		if f"{part}.json" in _dir_entries(str(cwd)):
 			# In some cases, we should just return the first possible match
 			if skip_file_search:
 				return json_path
@@ -276,7 +350,7 @@ def find_file_by_feature(feature, skip_file_search = False):
 				return json_path
 			# If it isn't, we'll check for a matching directory
 		
-		if os.path.exists(dir_path):
+		if part in _dir_entries(str(cwd)):
 			# A matching directory exists, continue search in that directory
 			cwd = dir_path
 			continue
@@ -303,52 +377,90 @@ def find_file_by_feature(feature, skip_file_search = False):
 	return False
 
 def non_empty(_, current):
+	import inquirer
+
 	if len(current) < 1:
 		raise inquirer.errors.ValidationError('', reason="Field cannot be blank.")
 	return True
 
-def run_command(description, command, silent=True):
+@functools.cache
+def _untracked_files():
+	# Cached so batching multiple PRs in one session only spawns git once;
+	# cleared after anything is staged
+	return subprocess.run(
+		['git', 'ls-files', '--other', '--exclude-standard'],
+		capture_output=True
+	).stdout.decode('utf-8')
+
+def run_command(description, command, silent=True, input=None):
 	print(description)
-	output = subprocess.run(command, capture_output=silent)
+	# Only stderr is ever read back (for the failure message); routing stdout
+	# to DEVNULL avoids allocating and draining a pipe that goes unused
+	output = subprocess.run(
+		command,
+		stdout=subprocess.DEVNULL if silent else None,
+		stderr=subprocess.PIPE if silent else None,
+		input=input
+	)
 	if output.returncode != 0:
 		raise Exception(output.stderr)
 
 def flatten(l):
-	return [item for sublist in l for item in sublist]
+	return list(chain.from_iterable(l))
 
 # --- Main Script ---
 
-def get_description(config):
-	title = pr_types[config['pr_type']].get('title', '')
-	description = pr_types[config['pr_type']].get('description', '')
-
-	if config['pr_type'] == 'New Entry':
-		title = pr_types['New Entry'][config['feature_addition_scope']]['title']
-		description = pr_types['New Entry'][config['feature_addition_scope']]['description']
-	elif config['pr_type'] == 'Feature Removal':
-		title = pr_types['Feature Removal'][config['feature_removal_scope']]['title']
-		description = pr_types['Feature Removal'][config['feature_removal_scope']]['description'] + " " + pr_types['Feature Removal']['reasons'].get(
+# Maps each PR type with scoped variants to a picker returning its (title,
+# description) pair; types not listed here fall back to their top-level strings
+_DESC_DISPATCH = {
+	'New Entry': lambda config: (
+		pr_types['New Entry'][config['feature_addition_scope']]['title'],
+		pr_types['New Entry'][config['feature_addition_scope']]['description']
+	),
+	'Feature Removal': lambda config: (
+		pr_types['Feature Removal'][config['feature_removal_scope']]['title'],
+		pr_types['Feature Removal'][config['feature_removal_scope']]['description'] + " " + pr_types['Feature Removal']['reasons'].get(
 			config['feature_removal_reason'], config['feature_removal_reason']
 		)
-	elif config['pr_type'] == 'Flag Removal':
-		title = pr_types['Flag Removal'][config['flag_removal_type']]['title']
-		description = pr_types['Flag Removal'][config['flag_removal_type']]['description']
+	),
+	'Flag Removal': lambda config: (
+		pr_types['Flag Removal'][config['flag_removal_type']]['title'],
+		pr_types['Flag Removal'][config['flag_removal_type']]['description']
+	),
+}
 
-	if config['source']['type']:
-		source_data = data_sources.get(config['source']['type'], None)
+def get_description(config):
+	pr_type = config['pr_type']
+	source = config['source']
+
+	title, description = _DESC_DISPATCH.get(
+		pr_type,
+		lambda config: (pr_types[config['pr_type']].get('title', ''), pr_types[config['pr_type']].get('description', ''))
+	)(config)
+
+	if source['type']:
+		source_data = data_sources.get(source['type'], None)
 		if source_data:
-			if config['pr_type'] != 'Feature Removal':
-				description += " " + source_data['description'].format(source=config['source']['data'])
+			if pr_type != 'Feature Removal':
+				description += " " + source_data['description'].format(source=source['data'], mdn_bcd_collector=_mdn_bcd_collector())
 			if 'source' in source_data.keys():
-				description += "\n\n" + source_data['source'].format(source=config['source']['data'])
+				description += "\n\n" + source_data['source'].format(source=source['data'])
 		else:
-			description += " " + config['source']['data']
-
-	fmt = dict(config)
-	del fmt['browser']
+			description += " " + source['data']
+
+	# Only the keys the templates actually reference, rather than copying the
+	# whole config and stripping the browser entry back out
+	fmt = {
+		'feature': config['feature'],
+		'title': config.get('title', ''),
+		'flag': config['flag'],
+		'feature_description': config.get('feature_description', ''),
+		'browser': config['browser']['name'],
+		'browser_full': config['browser']['long_name'],
+	}
 
-	title = title.format(**fmt, browser=config['browser']['name'], browser_full=config['browser']['long_name'])
-	description = description.format(**fmt, browser=config['browser']['name'], browser_full=config['browser']['long_name'])
+	title = title.format(**fmt)
+	description = description.format(**fmt, mdn_bcd_collector=_mdn_bcd_collector())
 
 	if config['additional_notes']:
 		description += "\n\nAdditional Notes: " + config['additional_notes']
@@ -356,6 +468,8 @@ def get_description(config):
 	return title + '\n\n' + description
 
 def get_config():
+	import inquirer
+
 	config = {
 		"pr_type": "",
 		"feature": "",
@@ -387,10 +501,10 @@ def get_config():
 	}
 
 	# Get PR type
-	config['pr_type'] = inquirer.list_input(
+	config['pr_type'] = sys.intern(inquirer.list_input(
 		"What type of pull request should this be?",
 		choices=pr_types.keys()
-	)
+	))
 
 	# Get details for flag removal type
 	if config['pr_type'] == 'Flag Removal':
@@ -423,11 +537,7 @@ def get_config():
 	# Get supporting information
 
 	if config['pr_type'] == 'New Entry':
-		untracked_files = subprocess.run(
-			['git', 'ls-files', '--other', '--exclude-standard'],
-			capture_output=True
-		).stdout.decode('utf-8')
-		if str(config['file']) in untracked_files:
+		if str(config['file']) in _untracked_files():
 			config['feature_addition_scope'] = 'entire'
 		else:
 			scopes = {
@@ -443,12 +553,7 @@ def get_config():
 	if config['pr_type'] not in ['New Entry', 'Metadata Corrections', 'Feature Removal']:
 		config['browser'] = inquirer.list_input(
 			'What browser is updated in this PR?',
-			choices=[
-				(
-					v if isinstance(v, str) else v['name'],
-					{"id": k, "name": v, "long_name": v} if isinstance(v, str) else {"id": k, **v}
-				) for k, v in browsers.items()
-			]
+			choices=_BROWSER_CHOICES
 		)
 
 	if config['pr_type'] == 'Feature Removal':
@@ -521,16 +626,19 @@ def get_config():
 	return config
 
 def do_lint(config):
+	import inquirer
+
 	if not config['file']:
 		return
 
-	# Run the fix command first
-	fix_run = subprocess.run(["npm", "run", "lint:fix", config["file"]])
+	# Run the fix command first; calling eslint directly through npx skips the
+	# npm-run wrapper's extra Node startup on every pass
+	subprocess.run(["npx", "--no", "eslint", "--fix", str(config["file"])])
 
 	# Recursively run linting
 	do_lint = True
 	while do_lint:
-		lint_run = subprocess.run(["npm", "run", "lint", config["file"]])
+		lint_run = subprocess.run(["npx", "--no", "eslint", str(config["file"])])
 		if lint_run.returncode == 0:
 			# If no errors were detected, proceed
 			do_lint = False
@@ -541,10 +649,18 @@ def do_lint(config):
 			do_lint = inquirer.confirm('Do you want to try linting again?', default=True)
 
 def do_pr(config):
+	import inquirer
+
 	action = "normal"
+	# One git invocation lists every local and origin-tracking ref, instead of
+	# spawning a separate process per existence probe
+	refs = subprocess.run(
+		['git', 'for-each-ref', '--format=%(refname)', 'refs/heads/', 'refs/remotes/origin/'],
+		capture_output=True
+	).stdout.decode('utf-8').splitlines()
 	branch_exists = {
-		"local": subprocess.run(['git', 'rev-parse', '--verify', config['branch']], capture_output=True).returncode == 0,
-		"remote": subprocess.run(['git', 'ls-remote', '--exit-code', '--heads', 'origin', config['branch']], capture_output=True).returncode == 0
+		"local": f"refs/heads/{config['branch']}" in refs,
+		"remote": f"refs/remotes/origin/{config['branch']}" in refs
 	}
 
 	# XXX Remove me once force pushing and branch deletion is supported
@@ -595,19 +711,20 @@ def do_pr(config):
 			print("Force pushed!")
 			return
 
-	current_branch = subprocess.run(['git', 'branch', '--show-current'], capture_output=True).stdout.decode("utf-8").replace('\n', '')
+	current_branch = subprocess.run(['git', 'rev-parse', '--abbrev-ref', 'HEAD'], capture_output=True).stdout.decode("utf-8").replace('\n', '')
 
 	run_command("Creating branch...", ['git', 'branch', config['branch']])
 	run_command("Checking out branch...", ['git', 'checkout', config['branch']])
-	
+	# The checkout may change the working tree, so the directory listings are stale
+	_dir_entries.cache_clear()
+
 	# Stage files if needed
 	if config['auto_stage']:
 		run_command(f"Staging {config['file']}...", ['git', 'add', config['file']])
+		_untracked_files.cache_clear()
 
-	# Create commit
-	run_command("Creating commit...", ['git', 'commit'] + flatten([
-		['-m', line] for line in config['description'].split('\n')
-	]))
+	# Create commit, streaming the message over stdin to keep argv small
+	run_command("Creating commit...", ['git', 'commit', '-F', '-'], input=config['description'].encode())
 
 	# Wait for user input (the user may want to change the commit message)
 	input("Make changes to the commit message and/or press Enter to continue")
@@ -621,6 +738,7 @@ def do_pr(config):
 		run_command("Stashing other changes...", ['git', 'stash'])
 	
 	run_command("Switching back to original branch...", ['git', 'checkout', current_branch])
+	_dir_entries.cache_clear()
 	run_command("Deleting new branch...", ['git', 'branch', '-d', config['branch']])
 
 	if not config['auto_stage']: